@@ -0,0 +1,302 @@
+"""Record/replay harness for performance regression tests of ``handler``.
+
+Record mode runs a real conversation through ``handler`` and writes every
+model request/response and every tool call (Exa, MCP, Mem0) to a cassette.
+Replay mode runs the same conversation offline against the cassette and
+reports LLM turns, tool calls, estimated prompt tokens and wall time so that
+``tests/test_replay.py`` can fail when a change exceeds the recorded budget.
+
+Replay builds the agent through the production ``_setup_tools`` and
+``_create_agent``, so toolkit and prompt changes show up in the replayed
+prompt. Only MCP tool schemas (owned by the MCP servers) and tool results
+come from the cassette.
+
+Record a new cassette (needs real API keys):
+
+    uv run python tests/replay.py record kyoto-family "Plan a 5-day cultural trip to Kyoto for a family of 4"
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from agno.tools.function import FunctionCall, FunctionExecutionResult
+from agno.tools.mcp import MultiMCPTools
+from mcp.types import ListToolsResult, Tool
+from openai.resources.chat.completions import AsyncCompletions
+from openai.types.chat import ChatCompletion
+
+from travel_agent.airbnb_cache import CachedMultiMCPTools
+from travel_agent.memory import CachedMem0Tools
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+
+# Headroom applied to the figures of the replay run made at record time.
+PROMPT_TOKEN_HEADROOM = 1.05
+WALL_TIME_HEADROOM = 5.0
+# Offline replays take well under a second, so timing noise on a loaded CI
+# runner would dominate a purely relative wall-time budget.
+MIN_WALL_TIME_BUDGET_SECONDS = 30.0
+
+
+class ReplayError(AssertionError):
+    """The replayed conversation diverged from its cassette."""
+
+
+@dataclass
+class ReplayReport:
+    """Work done while handling one conversation."""
+
+    llm_turns: int = 0
+    tool_calls: int = 0
+    prompt_tokens: int = 0
+    wall_time_seconds: float = 0.0
+
+    def budget_violations(self, budget: dict[str, float]) -> list[str]:
+        """Return a description of every figure that exceeds *budget*."""
+        return [
+            f"{key}: {value} > budget {budget[key]}"
+            for key, value in asdict(self).items()
+            if key in budget and value > budget[key]
+        ]
+
+
+def estimate_prompt_tokens(request: dict[str, Any]) -> int:
+    """Estimate prompt tokens for a chat completion request (~4 characters per token)."""
+    payload = {"messages": request.get("messages"), "tools": request.get("tools")}
+    return len(json.dumps(payload, default=str, ensure_ascii=False)) // 4
+
+
+def _agent_module() -> Any:
+    return importlib.import_module("travel_agent.main")
+
+
+def _tool_result_to_json(result: Any) -> Any:
+    content = getattr(result, "content", result)
+    return content if isinstance(content, (str, int, float, bool, type(None))) else str(content)
+
+
+@contextmanager
+def _recording(cassette: dict[str, Any]):
+    original_create = AsyncCompletions.create
+    original_execute = FunctionCall.execute
+    original_aexecute = FunctionCall.aexecute
+
+    async def create(self: AsyncCompletions, **kwargs: Any) -> Any:
+        response = await original_create(self, **kwargs)
+        cassette["model_exchanges"].append({
+            "request": {"messages": json.loads(json.dumps(kwargs.get("messages"), default=str))},
+            "response": response.model_dump(mode="json"),
+        })
+        return response
+
+    def record_call(function_call: FunctionCall) -> None:
+        cassette["tool_calls"].append({
+            "name": function_call.function.name,
+            "arguments": function_call.arguments or {},
+            "result": _tool_result_to_json(function_call.result),
+        })
+
+    def execute(self: FunctionCall) -> Any:
+        result = original_execute(self)
+        record_call(self)
+        return result
+
+    async def aexecute(self: FunctionCall) -> Any:
+        result = await original_aexecute(self)
+        record_call(self)
+        return result
+
+    with (
+        patch.object(AsyncCompletions, "create", create),
+        patch.object(FunctionCall, "execute", execute),
+        patch.object(FunctionCall, "aexecute", aexecute),
+    ):
+        yield
+
+
+async def record(name: str, messages: list[dict[str, str]], path: Path | None = None) -> dict[str, Any]:
+    """Run *messages* through the real ``handler`` and save the cassette."""
+    agent_module = _agent_module()
+    cassette: dict[str, Any] = {
+        "name": name,
+        "model": agent_module._get_api_keys()[3],
+        "toolkits": {"mem0": bool(os.getenv("MEM0_API_KEY"))},
+        "messages": messages,
+        "mcp_tools": [],
+        "model_exchanges": [],
+        "tool_calls": [],
+    }
+
+    await agent_module.initialize_agent()
+    # agno's response cache would answer a repeated request from disk without
+    # calling the model, leaving that exchange out of the cassette.
+    agent_module.agent.model.cache_response = False
+    with _recording(cassette), patch.object(agent_module, "_initialized", True):
+        await agent_module.handler(messages)
+    for toolkit in agent_module.agent.tools:
+        if isinstance(toolkit, MultiMCPTools):
+            cassette["mcp_tools"] = [
+                {"name": f.name, "description": f.description, "inputSchema": f.parameters}
+                for f in toolkit.functions.values()
+            ]
+    await agent_module.cleanup()
+
+    replayed = await replay(cassette)
+    cassette["recorded"] = asdict(replayed)
+    cassette["budget"] = {
+        "llm_turns": replayed.llm_turns,
+        "tool_calls": replayed.tool_calls,
+        "prompt_tokens": int(replayed.prompt_tokens * PROMPT_TOKEN_HEADROOM),
+        "wall_time_seconds": max(
+            round(replayed.wall_time_seconds * WALL_TIME_HEADROOM, 3), MIN_WALL_TIME_BUDGET_SECONDS
+        ),
+    }
+
+    path = path or CASSETTE_DIR / f"{name}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(cassette, indent=2) + "\n")
+    return cassette
+
+
+class _ReplayMCPSession:
+    """Stands in for an MCP client session, serving the recorded tool schemas."""
+
+    def __init__(self, tools: list[dict[str, Any]]) -> None:
+        self._tools = ListToolsResult(tools=[Tool(**tool) for tool in tools])
+
+    async def list_tools(self) -> ListToolsResult:
+        return self._tools
+
+    async def send_ping(self) -> None:
+        return None
+
+
+async def _build_production_tools(agent_module: Any, cassette: dict[str, Any]) -> list:
+    """Build the agent's toolkits through ``_setup_tools`` without touching the network."""
+
+    async def connect(self: CachedMultiMCPTools, force: bool = False) -> None:
+        self._sessions = [_ReplayMCPSession(cassette["mcp_tools"])]
+        self._initialized = True
+        await self.build_tools()
+
+    mem0_api_key = "replay" if cassette["toolkits"]["mem0"] else None
+    with (
+        patch("agno.tools.mem0.MemoryClient"),
+        patch.object(CachedMultiMCPTools, "connect", connect),
+        patch.object(agent_module, "memory_tools", None),
+    ):
+        tools, _ = await agent_module._setup_tools(mem0_api_key, "replay")
+    return tools
+
+
+def _replay_execute(tool_calls: list[dict[str, Any]], report: ReplayReport, divergences: list[str]) -> Any:
+    """Return a ``FunctionCall.execute`` replacement that serves recorded results."""
+
+    def execute(self: FunctionCall) -> FunctionExecutionResult:
+        report.tool_calls += 1
+        name, arguments = self.function.name, self.arguments or {}
+        for i, call in enumerate(tool_calls):
+            if call["name"] == name:
+                recorded = tool_calls.pop(i)
+                if recorded["arguments"] != arguments:
+                    divergences.append(f"Tool {name!r} called with {arguments}, recorded {recorded['arguments']}")
+                self.result = recorded["result"]
+                return FunctionExecutionResult(status="success", result=self.result)
+        divergences.append(f"Unexpected call to tool {name!r} with {arguments}")
+        return FunctionExecutionResult(status="failure", error=divergences[-1])
+
+    return execute
+
+
+async def replay(cassette: dict[str, Any]) -> ReplayReport:
+    """Run a cassette's conversation through ``handler`` without network access."""
+    agent_module = _agent_module()
+    report = ReplayReport()
+    responses = [exchange["response"] for exchange in cassette["model_exchanges"]]
+    tool_calls = list(cassette["tool_calls"])
+    # agno turns model and tool exceptions into error results, so divergences
+    # are collected here and raised once the handler returns.
+    divergences: list[str] = []
+
+    async def create(self: AsyncCompletions, **kwargs: Any) -> ChatCompletion:
+        report.llm_turns += 1
+        report.prompt_tokens += estimate_prompt_tokens(kwargs)
+        if not responses:
+            divergences.append(f"Unexpected LLM turn {report.llm_turns}; cassette {cassette['name']!r} is exhausted")
+            raise ReplayError(divergences[-1])
+        return ChatCompletion.model_validate(responses.pop(0))
+
+    execute = _replay_execute(tool_calls, report, divergences)
+
+    async def aexecute(self: FunctionCall) -> FunctionExecutionResult:
+        return execute(self)
+
+    tools = await _build_production_tools(agent_module, cassette)
+    model = agent_module._create_llm_model("replay", cassette["model"])
+    model.cache_response = False
+    agent = agent_module._create_agent(model, tools)
+    agent.telemetry = False
+
+    try:
+        with (
+            patch.object(AsyncCompletions, "create", create),
+            patch.object(FunctionCall, "execute", execute),
+            patch.object(FunctionCall, "aexecute", aexecute),
+            patch.object(agent_module, "agent", agent),
+            patch.object(agent_module, "_initialized", True),
+        ):
+            started = time.perf_counter()
+            await agent_module.handler(cassette["messages"])
+            report.wall_time_seconds = round(time.perf_counter() - started, 3)
+    finally:
+        for toolkit in tools:
+            if isinstance(toolkit, CachedMem0Tools):
+                toolkit.close()
+
+    divergences.extend(f"Recorded call to tool {call['name']!r} was never made" for call in tool_calls)
+    if divergences:
+        raise ReplayError("; ".join(divergences))
+    return report
+
+
+def load_cassettes() -> list[dict[str, Any]]:
+    """Load every recorded cassette."""
+    return [json.loads(path.read_text()) for path in sorted(CASSETTE_DIR.glob("*.json"))]
+
+
+def _main() -> None:
+    parser = argparse.ArgumentParser(description="Record or replay handler conversations")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    record_parser = subparsers.add_parser("record", help="Record a cassette against the real services")
+    record_parser.add_argument("name", help="Cassette name (file stem under tests/cassettes)")
+    record_parser.add_argument("prompt", help="User message to send")
+    subparsers.add_parser("replay", help="Replay every cassette and print its figures")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        cassette = asyncio.run(record(args.name, [{"role": "user", "content": args.prompt}]))
+        print(json.dumps(cassette["recorded"], indent=2))
+        return
+
+    over_budget = False
+    for cassette in load_cassettes():
+        report = asyncio.run(replay(cassette))
+        violations = report.budget_violations(cassette["budget"])
+        over_budget = over_budget or bool(violations)
+        print(f"{cassette['name']}: {asdict(report)}{' OVER BUDGET: ' + '; '.join(violations) if violations else ''}")
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,108 @@
+import json
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from agno.tools.function import ToolResult
+
+from travel_agent.airbnb_cache import AirbnbListingCache, CachedMultiMCPTools, Listing, search_key
+
+
+def _listing(
+    listing_id: str,
+    name: str,
+    price: str = "$500 for 5 nights",
+    checkin: str = "2026-04-01",
+    checkout: str = "2026-04-06",
+) -> dict:
+    return {
+        "id": listing_id,
+        "url": f"https://www.airbnb.com/rooms/{listing_id}?check_in={checkin}&check_out={checkout}",
+        "demandStayListing": {"description": {"name": {"localizedStringWithTranslationPreference": name}}},
+        "structuredDisplayPrice": {"primaryLine": {"accessibilityLabel": price}},
+        "avgRatingA11yLabel": "4.9 out of 5 average rating",
+        "structuredContent": {"primaryLine": "2 bedrooms"},
+        "listingParamOverrides": {"checkin": checkin, "checkout": checkout},
+    }
+
+
+def _search_response(*listings: dict) -> str:
+    return json.dumps({"searchUrl": "https://www.airbnb.com/s/Kyoto/homes", "searchResults": list(listings)})
+
+
+def test_search_key_normalizes_location_and_party_defaults():
+    """Test that equivalent searches share a cache key."""
+    first = search_key({"location": "Kyoto,  Japan", "checkin": "2026-04-01", "checkout": "2026-04-06"})
+    second = search_key({"location": "kyoto japan", "checkin": "2026-04-01", "checkout": "2026-04-06", "adults": 1})
+    other = search_key({"location": "kyoto japan", "checkin": "2026-04-01", "checkout": "2026-04-06", "adults": 4})
+
+    assert first == second
+    assert first != other
+
+
+def test_cache_stores_compact_deduplicated_listings():
+    """Test that listings are compacted and shared across searches."""
+    cache = AirbnbListingCache(ttl_seconds=60)
+    shared = _listing("1", "Machiya near Gion")
+
+    rendered = json.loads(cache.put(("kyoto", "a"), _search_response(shared, _listing("2", "Riverside flat"))))
+    cache.put(("kyoto", "b"), _search_response(shared))
+
+    assert cache.listing_count == 2
+    assert rendered["searchResults"][0] == {
+        "id": "1",
+        "name": "Machiya near Gion",
+        "url": "https://www.airbnb.com/rooms/1?check_in=2026-04-01&check_out=2026-04-06",
+        "price": "$500 for 5 nights",
+        "rating": "4.9 out of 5 average rating",
+        "summary": "2 bedrooms",
+    }
+    assert not hasattr(Listing("1", "", "", "", ""), "__dict__")
+
+
+def test_cache_expires_entries_and_ignores_errors():
+    """Test TTL expiry and that error responses are not cached."""
+    cache = AirbnbListingCache(ttl_seconds=60)
+
+    with patch("travel_agent.airbnb_cache.time.monotonic", return_value=1000.0):
+        cache.put(("kyoto",), _search_response(_listing("1", "Machiya")))
+        assert cache.get(("kyoto",)) is not None
+    with patch("travel_agent.airbnb_cache.time.monotonic", return_value=1061.0):
+        assert cache.get(("kyoto",)) is None
+
+    assert cache.put(("paris",), "Error from MCP tool 'airbnb_search': blocked") is None
+    assert cache.get(("paris",)) is None
+
+
+def test_shared_listing_keeps_per_search_prices_and_links():
+    """Test that a later search with other dates does not change an earlier search's prices or booking links."""
+    cache = AirbnbListingCache(ttl_seconds=60)
+    april = search_key({"location": "Kyoto", "checkin": "2026-04-01", "checkout": "2026-04-06"})
+    december = search_key({"location": "Kyoto", "checkin": "2026-12-20", "checkout": "2026-12-22", "adults": 4})
+
+    cache.put(april, _search_response(_listing("1", "Machiya")))
+    cache.put(december, _search_response(_listing("1", "Machiya", "$900 for 2 nights", "2026-12-20", "2026-12-22")))
+
+    [april_listing] = json.loads(cache.get(april))["searchResults"]
+    [december_listing] = json.loads(cache.get(december))["searchResults"]
+    assert cache.listing_count == 1
+    assert april_listing["price"] == "$500 for 5 nights"
+    assert december_listing["price"] == "$900 for 2 nights"
+    assert april_listing["url"] == "https://www.airbnb.com/rooms/1?check_in=2026-04-01&check_out=2026-04-06"
+    assert december_listing["url"] == "https://www.airbnb.com/rooms/1?check_in=2026-12-20&check_out=2026-12-22"
+    assert cache._listings["1"].url == "https://www.airbnb.com/rooms/1"
+
+
+@pytest.mark.asyncio
+async def test_cached_search_skips_repeat_mcp_calls():
+    """Test that a repeated search is served without calling the MCP server."""
+    tools = CachedMultiMCPTools(commands=[sys.executable], airbnb_cache_ttl_seconds=60)
+    call_tool = AsyncMock(return_value=ToolResult(content=_search_response(_listing("1", "Machiya"))))
+    search = tools._cached_search(call_tool)
+
+    first = await search(location="Kyoto", checkin="2026-04-01", checkout="2026-04-06")
+    second = await search(location="kyoto", checkin="2026-04-01", checkout="2026-04-06")
+
+    call_tool.assert_awaited_once()
+    assert first.content == second.content
+    assert tools.airbnb_cache.hits == 1
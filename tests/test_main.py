@@ -1,8 +1,22 @@
+import asyncio
+from datetime import date
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from travel_agent.main import APIKeyError, handler
+from travel_agent.main import (
+    SYSTEM_PROMPT,
+    APIKeyError,
+    _active_runs,
+    _build_system_prompt,
+    _cancellation_stats,
+    _get_airbnb_cache_ttl,
+    _prompt_cache_stats,
+    get_cancellation_stats,
+    get_prompt_cache_stats,
+    handler,
+    run_agent,
+)
 
 
 @pytest.mark.asyncio
@@ -189,3 +203,75 @@ async def test_handler_with_exa_api_key_missing():
         pytest.raises(APIKeyError, match="Exa API key required"),
     ):
         await handler(messages)
+
+
+@pytest.mark.asyncio
+async def test_run_agent_propagates_cancellation_to_agent():
+    """Test that cancelling a handler task aborts the agent run and records it."""
+    started = asyncio.Event()
+    aborted = asyncio.Event()
+
+    async def slow_arun(messages, run_id, user_id):
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            aborted.set()
+            raise
+
+    mock_agent = MagicMock()
+    mock_agent.arun = slow_arun
+
+    with patch("travel_agent.main.agent", mock_agent), patch.dict(_cancellation_stats, {"runs_cancelled": 0}):
+        task = asyncio.create_task(run_agent([{"role": "user", "content": "Test"}]))
+        await started.wait()
+        assert len(_active_runs) == 1
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert aborted.is_set()
+        assert get_cancellation_stats()["runs_cancelled"] == 1
+        assert get_cancellation_stats()["active_runs"] == 0
+
+
+def test_system_prompt_is_static_prefix():
+    """Test that the compiled system prompt is byte-stable and free of volatile content."""
+    assert _build_system_prompt() == SYSTEM_PROMPT
+    assert SYSTEM_PROMPT.startswith("You are Globe Hopper")
+    assert date.today().isoformat() not in SYSTEM_PROMPT
+
+
+@pytest.mark.asyncio
+async def test_run_agent_appends_context_and_reports_cached_tokens():
+    """Test that volatile context follows the static prompt and cache usage is recorded."""
+    messages = [{"role": "user", "content": "Plan a weekend in Lisbon"}]
+
+    mock_response = MagicMock()
+    mock_response.metrics.input_tokens = 2000
+    mock_response.metrics.cache_read_tokens = 1536
+
+    mock_agent = MagicMock()
+    mock_agent.arun = AsyncMock(return_value=mock_response)
+
+    with (
+        patch("travel_agent.main.agent", mock_agent),
+        patch.dict(_prompt_cache_stats, {"requests": 0, "input_tokens": 0, "cached_input_tokens": 0}),
+    ):
+        result = await run_agent(messages)
+        stats = get_prompt_cache_stats()
+
+    assert result is mock_response
+    sent = mock_agent.arun.await_args.args[0]
+    assert sent[0]["role"] == "system"
+    assert date.today().isoformat() in sent[0]["content"]
+    assert sent[1:] == messages
+    assert stats == {"requests": 1, "input_tokens": 2000, "cached_input_tokens": 1536, "uncached_input_tokens": 464}
+
+
+@pytest.mark.parametrize(("value", "expected"), [("60", 60.0), ("0", 0.0), ("five minutes", 300.0), ("-1", 300.0)])
+def test_airbnb_cache_ttl_is_validated(value, expected):
+    """Test that an invalid cache TTL falls back to the default instead of disabling MCP tools."""
+    with patch.dict("os.environ", {"AIRBNB_CACHE_TTL_SECONDS": value}):
+        assert _get_airbnb_cache_ttl() == expected
@@ -0,0 +1,211 @@
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from agno.run import RunContext
+
+from travel_agent.memory import CachedMem0Tools
+
+
+@pytest.fixture
+def memory_tools():
+    """Create a CachedMem0Tools instance backed by a mock Mem0 client."""
+    with patch("agno.tools.mem0.MemoryClient") as mock_client_cls:
+        mock_client = mock_client_cls.return_value
+        mock_client.get_all.return_value = {"results": [{"memory": "Prefers window seats"}]}
+        mock_client.search.return_value = {"results": [{"memory": "Allergic to peanuts"}]}
+        tools = CachedMem0Tools(api_key="test-key", flush_interval_seconds=60)
+    yield tools
+    tools.close()
+
+
+@pytest.fixture
+def run_context():
+    """Create a run context for a request from a known user."""
+    return RunContext(run_id="run-1", session_id="session-1", user_id="user-a")
+
+
+def test_add_memory_is_queued_not_sent(memory_tools, run_context):
+    """Test that writes are deferred off the request path."""
+    result = json.loads(memory_tools.add_memory(run_context, "Travelling to Kyoto in April"))
+
+    assert result["status"] == "queued"
+    memory_tools.client.add.assert_not_called()
+
+
+def test_flush_batches_writes_per_user(memory_tools, run_context):
+    """Test that queued writes for a user are sent in a single call."""
+    memory_tools.add_memory(run_context, "Travelling to Kyoto in April")
+    memory_tools.add_memory(run_context, {"budget": "$3000"})
+
+    assert memory_tools.flush() == 2
+    memory_tools.client.add.assert_called_once_with(
+        [
+            {"role": "user", "content": "Travelling to Kyoto in April"},
+            {"role": "user", "content": '{"budget": "$3000"}'},
+        ],
+        user_id="user-a",
+        infer=True,
+    )
+
+
+def test_reads_are_cached_and_include_own_writes(memory_tools, run_context):
+    """Test read caching and read-your-writes before the batch is flushed."""
+    memory_tools.add_memory(run_context, "Travelling to Kyoto in April")
+
+    first = json.loads(memory_tools.get_all_memories(run_context))
+    second = json.loads(memory_tools.get_all_memories(run_context))
+
+    assert first == second
+    assert [m["memory"] for m in first] == ["Travelling to Kyoto in April", "Prefers window seats"]
+    memory_tools.client.get_all.assert_called_once()
+
+    found = json.loads(memory_tools.search_memory(run_context, "kyoto trip"))
+    json.loads(memory_tools.search_memory(run_context, "Kyoto  trip"))
+    assert [m["memory"] for m in found] == ["Travelling to Kyoto in April", "Allergic to peanuts"]
+    memory_tools.client.search.assert_called_once()
+
+
+def test_failed_flush_keeps_writes_queued(memory_tools, run_context):
+    """Test that writes are retried when Mem0 rejects a batch."""
+    memory_tools.client.add.side_effect = [RuntimeError("unavailable"), MagicMock()]
+    memory_tools.add_memory(run_context, "Travelling to Kyoto in April")
+
+    assert memory_tools.flush() == 0
+    assert memory_tools.flush() == 1
+    assert memory_tools.client.add.call_count == 2
+
+
+def test_memory_requires_user_id(memory_tools):
+    """Test that nothing is read or queued when no user ID reaches the run."""
+    anonymous = RunContext(run_id="run-2", session_id="session-1")
+
+    assert memory_tools.add_memory(anonymous, "Travelling to Kyoto").startswith("Error in add_memory:")
+    assert memory_tools.get_all_memories(anonymous).startswith("Error in get_all_memories:")
+    assert memory_tools.flush() == 0
+    memory_tools.client.get_all.assert_not_called()
+
+
+def test_local_writes_are_isolated_per_user(memory_tools, run_context):
+    """Test that one user's unflushed writes are not visible to another user."""
+    other_user = RunContext(run_id="run-2", session_id="session-1", user_id="user-b")
+    memory_tools.add_memory(run_context, "Travelling to Kyoto in April")
+
+    memories = json.loads(memory_tools.get_all_memories(other_user))
+
+    assert "Travelling to Kyoto in April" not in [m["memory"] for m in memories]
+
+
+def test_flushed_writes_kept_until_mem0_returns_them(memory_tools, run_context):
+    """Test read-your-writes while Mem0 is still indexing a flushed write."""
+    memory_tools.add_memory(run_context, "Travelling to Kyoto in April")
+    memory_tools.flush()
+    memory_tools.cache_ttl_seconds = 0
+
+    still_indexing = json.loads(memory_tools.get_all_memories(run_context))
+    memory_tools.client.get_all.return_value = {"results": [{"memory": "Travelling to Kyoto in April"}]}
+    indexed = json.loads(memory_tools.get_all_memories(run_context))
+
+    assert [m["memory"] for m in still_indexing] == ["Travelling to Kyoto in April", "Prefers window seats"]
+    assert [m["memory"] for m in indexed] == ["Travelling to Kyoto in April"]
+
+
+def test_flushed_writes_survive_until_reads_are_refreshed(memory_tools, run_context):
+    """Test read-your-writes when Mem0 rewrites a flushed memory instead of storing it verbatim."""
+    clock = MagicMock()
+    with patch("travel_agent.memory.time", clock):
+        clock.monotonic.return_value = 0
+        memory_tools.get_all_memories(run_context)
+        memory_tools.add_memory(run_context, "Travelling to Kyoto in April")
+        clock.monotonic.return_value = 1
+        memory_tools.flush()
+
+        clock.monotonic.return_value = 50
+        still_indexing = json.loads(memory_tools.get_all_memories(run_context))
+        memory_tools.client.get_all.return_value = {
+            "results": [{"memory": "Plans a Kyoto trip in April"}, {"memory": "Prefers window seats"}]
+        }
+        clock.monotonic.return_value = 200
+        cached = json.loads(memory_tools.get_all_memories(run_context))
+        memory_tools.cache_ttl_seconds = 0
+        refreshed = json.loads(memory_tools.get_all_memories(run_context))
+
+    assert [m["memory"] for m in still_indexing] == ["Travelling to Kyoto in April", "Prefers window seats"]
+    assert cached == still_indexing
+    assert [m["memory"] for m in refreshed] == ["Plans a Kyoto trip in April", "Prefers window seats"]
+    assert memory_tools.client.get_all.call_count == 3
+
+
+def test_local_writes_are_capped(memory_tools, run_context):
+    """Test that the overlay of local writes is bounded."""
+    memory_tools.max_local_memories = 3
+    for i in range(5):
+        memory_tools.add_memory(run_context, f"Fact {i}")
+
+    assert [m["memory"] for m in memory_tools._local_memories("user-a")] == ["Fact 2", "Fact 3", "Fact 4"]
+
+
+def _rejected(status_code: int) -> Exception:
+    error = RuntimeError("rejected")
+    error.debug_info = {"status_code": status_code}
+    return error
+
+
+def test_rejected_memory_does_not_block_the_batch(memory_tools, run_context):
+    """Test that a memory Mem0 rejects is dropped while the rest of its batch is saved."""
+    memory_tools.client.add.side_effect = [_rejected(400), None, _rejected(422), None]
+    for fact in ("Fact 1", "Bad fact", "Fact 2"):
+        memory_tools.add_memory(run_context, fact)
+
+    assert memory_tools.flush() == 2
+    assert memory_tools.flush() == 0
+    sent = [call.args[0] for call in memory_tools.client.add.call_args_list[1:]]
+    assert sent == [[{"role": "user", "content": fact}] for fact in ("Fact 1", "Bad fact", "Fact 2")]
+    assert "Bad fact" not in [m["memory"] for m in memory_tools._local_memories("user-a")]
+
+
+def test_failing_flushes_back_off_and_give_up(memory_tools, run_context):
+    """Test that transient failures are retried with backoff, then dropped after max attempts."""
+    memory_tools.max_flush_attempts = 2
+    memory_tools.client.add.side_effect = RuntimeError("unavailable")
+    memory_tools.add_memory(run_context, "Travelling to Kyoto in April")
+
+    memory_tools.flush()
+    assert memory_tools._flush(due_only=True) == 0
+    assert memory_tools.client.add.call_count == 1
+
+    memory_tools.flush()
+    assert memory_tools._pending == {}
+    assert memory_tools._local_memories("user-a") == []
+
+
+def test_pending_writes_are_bounded(memory_tools, run_context):
+    """Test that writes are refused rather than queued without limit while Mem0 is unreachable."""
+    memory_tools.max_pending_writes = 2
+    memory_tools.add_memory(run_context, "Fact 1")
+    memory_tools.add_memory(run_context, "Fact 2")
+
+    assert memory_tools.add_memory(run_context, "Fact 3").startswith("Error in add_memory:")
+    assert sum(len(contents) for contents in memory_tools._pending.values()) == 2
+
+
+def test_delete_waits_for_in_flight_batch(memory_tools, run_context):
+    """Test that a batch failing during a delete is not re-queued after the delete."""
+    deleter = threading.Thread(target=memory_tools.delete_all_memories, args=(run_context,))
+    seen = {}
+
+    def add(*args, **kwargs):
+        deleter.start()
+        deleter.join(0.2)
+        seen["delete_waited"] = deleter.is_alive()
+        raise RuntimeError("unavailable")
+
+    memory_tools.client.add.side_effect = add
+    memory_tools.add_memory(run_context, "Travelling to Kyoto in April")
+
+    assert memory_tools.flush() == 0
+    deleter.join(5)
+    assert seen == {"delete_waited": True}
+    assert memory_tools._pending == {}
+    memory_tools.client.delete_all.assert_called_once_with(user_id="user-a")
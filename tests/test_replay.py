@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+import pytest
+from agno.tools.exa import ExaTools
+from replay import ReplayError, load_cassettes, replay
+
+from travel_agent.main import SYSTEM_PROMPT
+
+CASSETTES = load_cassettes()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cassette", CASSETTES, ids=[c["name"] for c in CASSETTES])
+async def test_cassette_within_budget(cassette):
+    """Test that replaying a recorded conversation stays within its recorded budget."""
+    report = await replay(cassette)
+
+    assert report.budget_violations(cassette["budget"]) == []
+
+
+@pytest.mark.asyncio
+async def test_prompt_growth_exceeds_budget():
+    """Test that inflating the static prompt is reported as a budget violation."""
+    cassette = CASSETTES[0]
+
+    with patch("travel_agent.main.SYSTEM_PROMPT", SYSTEM_PROMPT * 2):
+        report = await replay(cassette)
+
+    assert [v.split(":")[0] for v in report.budget_violations(cassette["budget"])] == ["prompt_tokens"]
+
+
+@pytest.mark.asyncio
+async def test_extra_llm_turn_fails_replay():
+    """Test that a conversation needing more LLM turns than recorded fails."""
+    cassette = {**CASSETTES[0], "model_exchanges": CASSETTES[0]["model_exchanges"][:1]}
+
+    with pytest.raises(ReplayError, match="exhausted"):
+        await replay(cassette)
+
+
+@pytest.mark.asyncio
+async def test_longer_tool_description_exceeds_budget():
+    """Test that growing a production toolkit's tool schema is reported as prompt growth."""
+    cassette = CASSETTES[0]
+
+    with patch.object(ExaTools.search_exa, "__doc__", "Search thoroughly. " * 200 + ExaTools.search_exa.__doc__):
+        report = await replay(cassette)
+
+    assert [v.split(":")[0] for v in report.budget_violations(cassette["budget"])] == ["prompt_tokens"]
+
+
+@pytest.mark.asyncio
+async def test_changed_tool_arguments_fail_replay():
+    """Test that calling a recorded tool with different arguments is a divergence."""
+    tool_calls = [{**call, "arguments": {**call["arguments"], "adults": 3}} for call in CASSETTES[0]["tool_calls"]]
+    cassette = {**CASSETTES[0], "tool_calls": tool_calls}
+
+    with pytest.raises(ReplayError, match="called with"):
+        await replay(cassette)
@@ -0,0 +1,118 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from agno.run.cancel import acancel_run, acleanup_run, araise_if_cancelled, aregister_run
+from bindu.penguin.manifest import create_manifest
+from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
+from bindu.server.storage.memory_storage import InMemoryStorage
+from bindu.server.task_manager import TaskManager
+
+from travel_agent.main import _cancellation_stats, cancel_agent_run, get_cancellation_stats, handler
+from travel_agent.task_context import install_task_cancellation
+
+
+def _send_request(text: str) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": str(uuid4()),
+        "method": "message/send",
+        "params": {
+            "message": {
+                "role": "user",
+                "parts": [{"kind": "text", "text": text}],
+                "kind": "message",
+                "message_id": str(uuid4()),
+                "context_id": str(uuid4()),
+                "task_id": str(uuid4()),
+            },
+        },
+    }
+
+
+async def _wait_for_state(task_manager: TaskManager, task_id, state: str) -> str:
+    for _ in range(200):
+        current = (await task_manager.storage.load_task(task_id))["status"]["state"]
+        if current == state:
+            break
+        await asyncio.sleep(0.01)
+    return current
+
+
+@asynccontextmanager
+async def _task_manager():
+    """Run a bindu TaskManager whose worker calls the real ``handler``."""
+    install_task_cancellation(cancel_agent_run)
+    manifest = create_manifest(
+        agent_function=handler,
+        id=uuid4(),
+        did_extension=SimpleNamespace(did="did:bindu:test"),
+        name="travel-agent",
+        description=None,
+        skills=None,
+        capabilities=None,
+        agent_trust=None,
+        version="1.0.0",
+        url="http://127.0.0.1:3773",
+        enable_system_message=False,
+    )
+    async with TaskManager(scheduler=InMemoryScheduler(), storage=InMemoryStorage(), manifest=manifest) as manager:
+        yield manager
+
+
+@pytest.mark.asyncio
+async def test_tasks_cancel_stops_running_agent():
+    """Test that tasks/cancel flags and aborts the agent run and frees the worker.
+
+    The run is keyed on the bindu task id and remembers per conversation context.
+    """
+    started = asyncio.Event()
+    tool_released = threading.Event()
+    outcome = {}
+
+    async def arun(messages, run_id, user_id):
+        await aregister_run(run_id)
+        outcome["run_id"], outcome["user_id"] = run_id, user_id
+        started.set()
+        try:
+            # A sync tool call that agno runs in a worker thread.
+            await asyncio.to_thread(tool_released.wait, 5)
+            outcome["finished"] = True
+        except asyncio.CancelledError:
+            with pytest.raises(Exception, match="cancelled"):
+                await araise_if_cancelled(run_id)
+            outcome["flagged"] = True
+            raise
+        finally:
+            await acleanup_run(run_id)
+
+    mock_agent = MagicMock()
+    mock_agent.arun = arun
+    mock_agent.acancel_run = acancel_run
+
+    with (
+        patch("travel_agent.main._initialized", True),
+        patch("travel_agent.main.agent", mock_agent),
+        patch.dict(_cancellation_stats, {"cancel_requests": 0, "runs_cancelled": 0}),
+    ):
+        async with _task_manager() as task_manager:
+            send = await task_manager.send_message(_send_request("Plan a weekend in Lisbon"))
+            task_id, context_id = send["result"]["id"], send["result"]["context_id"]
+            await asyncio.wait_for(started.wait(), 5)
+
+            # Answered while the tool thread is still blocked, so the worker is free again.
+            cancel = {"jsonrpc": "2.0", "id": "1", "method": "tasks/cancel", "params": {"task_id": task_id}}
+            response = await asyncio.wait_for(task_manager.cancel_task(cancel), 1)
+            tool_released.set()
+
+            assert "error" not in response
+            assert await _wait_for_state(task_manager, task_id, "canceled") == "canceled"
+            assert outcome == {"run_id": str(task_id), "user_id": str(context_id), "flagged": True}
+            stats = get_cancellation_stats()
+            assert stats["cancel_requests"] == 1
+            assert stats["runs_cancelled"] == 1
+            assert stats["active_runs"] == 0
@@ -12,6 +12,8 @@
 from travel_agent.__version__ import __version__
 from travel_agent.main import (
     cleanup,
+    get_cancellation_stats,
+    get_prompt_cache_stats,
     handler,
     initialize_agent,
     main,
@@ -20,6 +22,8 @@ from travel_agent.main import (
 __all__ = [
     "__version__",
     "cleanup",
+    "get_cancellation_stats",
+    "get_prompt_cache_stats",
     "handler",
     "initialize_agent",
     "main",
@@ -0,0 +1,246 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Short-TTL cache for Airbnb MCP search results.
+
+Search results are keyed on the normalized location, date range and party
+size. The date-independent part of each listing is stored once as a compact
+slotted record and shared by every cached search that returned it; prices
+and booking-link query strings, which depend on dates and party size, stay
+with the search.
+"""
+
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from agno.tools.function import ToolResult
+from agno.tools.mcp import MultiMCPTools
+
+_logger = logging.getLogger(__name__)
+
+AIRBNB_SEARCH_TOOL = "airbnb_search"
+
+# Search arguments that change which listings come back; anything else is ignored.
+_KEY_FIELDS = (
+    "placeId",
+    "checkin",
+    "checkout",
+    "adults",
+    "children",
+    "infants",
+    "pets",
+    "minPrice",
+    "maxPrice",
+    "cursor",
+)
+_PARTY_DEFAULTS = {"adults": 1, "children": 0, "infants": 0, "pets": 0}
+_LISTING_FIELDS = ("id", "name", "url", "rating", "summary")
+
+
+class Listing:
+    """A compact Airbnb listing record holding only date-independent fields."""
+
+    __slots__ = ("id", "name", "rating", "summary", "url")
+
+    def __init__(self, listing_id: str, url: str, name: str, rating: str, summary: str) -> None:
+        """Create a listing record."""
+        self.id = listing_id
+        self.url = url
+        self.name = name
+        self.rating = rating
+        self.summary = summary
+
+    def to_dict(self, price: str = "", query: str = "") -> dict[str, str]:
+        """Return the listing, with the price and booking-link query of one search, as a JSON-serializable dict."""
+        listing = {field: value for field in _LISTING_FIELDS if (value := getattr(self, field))}
+        if query and self.url:
+            listing["url"] = f"{self.url}?{query}"
+        if price:
+            listing["price"] = price
+        return listing
+
+
+class _SearchEntry:
+    __slots__ = ("expires_at", "listing_ids", "pagination", "prices", "queries", "search_url")
+
+    def __init__(
+        self,
+        expires_at: float,
+        search_url: str,
+        listing_ids: tuple[str, ...],
+        prices: tuple[str, ...],
+        queries: tuple[str, ...],
+        pagination: Any,
+    ) -> None:
+        self.expires_at = expires_at
+        self.search_url = search_url
+        self.listing_ids = listing_ids
+        self.prices = prices
+        self.queries = queries
+        self.pagination = pagination
+
+
+def _dig(data: Any, *path: str) -> Any:
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _parse_listing(raw: dict[str, Any]) -> tuple[Listing, str, str] | None:
+    """Split a raw search result into its shared listing record, its price and its URL query string."""
+    listing_id = raw.get("id") or _dig(raw, "demandStayListing", "id")
+    if not listing_id:
+        return None
+    # The query string carries the search's dates and guests.
+    url, _, query = (raw.get("url") or "").partition("?")
+    listing = Listing(
+        listing_id=str(listing_id),
+        url=url,
+        name=_dig(raw, "demandStayListing", "description", "name", "localizedStringWithTranslationPreference") or "",
+        rating=raw.get("avgRatingA11yLabel") or "",
+        summary=_dig(raw, "structuredContent", "primaryLine") or "",
+    )
+    return listing, _dig(raw, "structuredDisplayPrice", "primaryLine", "accessibilityLabel") or "", query
+
+
+def search_key(arguments: dict[str, Any]) -> tuple[Any, ...]:
+    """Build a cache key from Airbnb search arguments."""
+    location = " ".join(str(arguments.get("location", "")).lower().replace(",", " ").split())
+    values = []
+    for field in _KEY_FIELDS:
+        value = arguments.get(field, _PARTY_DEFAULTS.get(field))
+        values.append(str(value).strip().lower() if value is not None else None)
+    return (location, *values)
+
+
+class AirbnbListingCache:
+    """TTL cache of Airbnb searches with de-duplicated listing storage."""
+
+    def __init__(self, ttl_seconds: float = 300.0) -> None:
+        """Create an empty cache whose searches expire after *ttl_seconds*."""
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._searches: dict[tuple[Any, ...], _SearchEntry] = {}
+        self._listings: dict[str, Listing] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached searches."""
+        return len(self._searches)
+
+    @property
+    def listing_count(self) -> int:
+        """Number of distinct listings currently held."""
+        return len(self._listings)
+
+    def get(self, key: tuple[Any, ...]) -> str | None:
+        """Return the cached search response for *key*, if still fresh."""
+        entry = self._searches.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return self._render(entry)
+
+    def put(self, key: tuple[Any, ...], response: str) -> str | None:
+        """Store a raw search response and return its compact rendering.
+
+        Returns None when the response is not a recognizable search result,
+        in which case nothing is cached.
+        """
+        try:
+            data = json.loads(response)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get("searchResults"), list):
+            return None
+
+        self._evict_expired()
+        listing_ids = []
+        prices = []
+        queries = []
+        shared_queries: dict[str, str] = {}
+        for raw in data["searchResults"]:
+            parsed = _parse_listing(raw) if isinstance(raw, dict) else None
+            if parsed is not None:
+                listing, price, query = parsed
+                self._listings[listing.id] = listing
+                listing_ids.append(listing.id)
+                prices.append(price)
+                # Listings of one search usually share a query string; keep one copy of it.
+                queries.append(shared_queries.setdefault(query, query))
+
+        entry = _SearchEntry(
+            expires_at=time.monotonic() + self.ttl_seconds,
+            search_url=data.get("searchUrl") or "",
+            listing_ids=tuple(listing_ids),
+            prices=tuple(prices),
+            queries=tuple(queries),
+            pagination=data.get("paginationInfo"),
+        )
+        self._searches[key] = entry
+        return self._render(entry)
+
+    def _render(self, entry: _SearchEntry) -> str:
+        results = [
+            self._listings[i].to_dict(price, query)
+            for i, price, query in zip(entry.listing_ids, entry.prices, entry.queries, strict=True)
+            if i in self._listings
+        ]
+        response: dict[str, Any] = {"searchUrl": entry.search_url, "searchResults": results}
+        if entry.pagination:
+            response["paginationInfo"] = entry.pagination
+        return json.dumps(response)
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        self._searches = {key: entry for key, entry in self._searches.items() if entry.expires_at > now}
+        live = {i for entry in self._searches.values() for i in entry.listing_ids}
+        self._listings = {i: listing for i, listing in self._listings.items() if i in live}
+
+
+class CachedMultiMCPTools(MultiMCPTools):
+    """MultiMCPTools that serves repeated Airbnb searches from a local cache."""
+
+    def __init__(self, *args: Any, airbnb_cache_ttl_seconds: float = 300.0, **kwargs: Any) -> None:
+        """Create the toolkit with an Airbnb search cache."""
+        super().__init__(*args, **kwargs)
+        self.airbnb_cache = AirbnbListingCache(ttl_seconds=airbnb_cache_ttl_seconds)
+
+    async def build_tools(self) -> None:
+        """Register MCP tools, routing Airbnb searches through the cache."""
+        await super().build_tools()
+
+        function = self.functions.get(AIRBNB_SEARCH_TOOL)
+        if function is not None and function.entrypoint is not None:
+            function.entrypoint = self._cached_search(function.entrypoint)
+
+    def _cached_search(self, call_tool: Callable[..., Awaitable[ToolResult]]) -> Callable[..., Awaitable[ToolResult]]:
+        cache = self.airbnb_cache
+
+        async def airbnb_search(
+            run_context: Any = None, agent: Any = None, team: Any = None, **kwargs: Any
+        ) -> ToolResult:
+            key = search_key(kwargs)
+            cached = cache.get(key)
+            if cached is not None:
+                _logger.debug("Airbnb search cache hit for %s", key)
+                return ToolResult(content=cached)
+
+            result = await call_tool(run_context=run_context, agent=agent, team=team, **kwargs)
+            compact = cache.put(key, result.content) if not result.images else None
+            return ToolResult(content=compact) if compact is not None else result
+
+        return airbnb_search
@@ -20,26 +20,44 @@ import json
 import logging
 import os
 import sys
+import time
 import traceback
+from datetime import date
 from pathlib import Path
 from textwrap import dedent
 from typing import Any, cast
+from uuid import uuid4
 
 from agno.agent import Agent
 from agno.models.openrouter import OpenRouter
 from agno.tools.exa import ExaTools
 from agno.tools.mcp import MultiMCPTools
-from agno.tools.mem0 import Mem0Tools
 from bindu.penguin.bindufy import bindufy
 from dotenv import load_dotenv
 
+from travel_agent.airbnb_cache import CachedMultiMCPTools
+from travel_agent.memory import CachedMem0Tools
+from travel_agent.task_context import current_context_id, current_task_id, install_task_cancellation
+
 # Load environment variables from .env file
 load_dotenv()
 
 # Global instances
 agent: Agent | None = None
+memory_tools: CachedMem0Tools | None = None
 _initialized = False
 _init_lock = asyncio.Lock()
+_active_runs: set[str] = set()
+_cancellation_stats: dict[str, float] = {
+    "cancel_requests": 0,
+    "runs_cancelled": 0,
+    "cancelled_run_seconds": 0.0,
+}
+_prompt_cache_stats: dict[str, int] = {
+    "requests": 0,
+    "input_tokens": 0,
+    "cached_input_tokens": 0,
+}
 _logger = logging.getLogger(__name__)
 
 
@@ -116,8 +134,23 @@ def _create_llm_model(openrouter_api_key: str, model_name: str) -> OpenRouter:
     )
 
 
-def _setup_tools(mem0_api_key: str | None, exa_api_key: str) -> tuple[list, MultiMCPTools | None]:
+def _get_airbnb_cache_ttl() -> float:
+    """Read the Airbnb search cache TTL from the environment, falling back to 300 seconds."""
+    value = os.getenv("AIRBNB_CACHE_TTL_SECONDS", "300")
+    try:
+        ttl = float(value)
+    except ValueError:
+        ttl = float("nan")
+    if not ttl >= 0:
+        print(f"⚠️  Invalid AIRBNB_CACHE_TTL_SECONDS={value!r}, using 300 seconds")
+        return 300.0
+    return ttl
+
+
+async def _setup_tools(mem0_api_key: str | None, exa_api_key: str) -> tuple[list, MultiMCPTools | None]:
     """Set up all tools for the travel agent."""
+    global memory_tools
+
     tools = []
     mcp_tools = None
 
@@ -133,15 +166,16 @@ def _setup_tools(mem0_api_key: str | None, exa_api_key: str) -> tuple[list, Mult
     # Optional: Mem0 for conversation memory
     if mem0_api_key:
         try:
-            mem0_tools = Mem0Tools(api_key=mem0_api_key)
-            tools.append(mem0_tools)
+            memory_tools = CachedMem0Tools(api_key=mem0_api_key)
+            tools.append(memory_tools)
             print("🧠 Mem0 memory system enabled for conversation context")
         except Exception as e:
             print(f"⚠️  Mem0 initialization issue: {e}")
 
     # Optional: MCP tools for Airbnb and Google Maps
+    airbnb_cache_ttl_seconds = _get_airbnb_cache_ttl()
     try:
-        mcp_tools = MultiMCPTools(
+        mcp_tools = CachedMultiMCPTools(
             commands=[
                 "npx -y @openbnb/mcp-server-airbnb --ignore-robots-txt",
                 "npx -y @modelcontextprotocol/server-google-maps",
@@ -149,8 +183,9 @@ def _setup_tools(mem0_api_key: str | None, exa_api_key: str) -> tuple[list, Mult
             env=dict(os.environ),
             allow_partial_failure=True,
             timeout_seconds=30,
+            airbnb_cache_ttl_seconds=airbnb_cache_ttl_seconds,
         )
-        asyncio.run(mcp_tools.connect())
+        await mcp_tools.connect()
         tools.append(mcp_tools)
         print("🏨 MCP tools enabled (Airbnb + Google Maps)")
     except Exception as e:
@@ -160,6 +195,245 @@ def _setup_tools(mem0_api_key: str | None, exa_api_key: str) -> tuple[list, Mult
     return tools, mcp_tools
 
 
+_DESCRIPTION = dedent("""\
+    You are Globe Hopper, an elite travel planning expert with decades of experience! 🌍
+
+    Your expertise encompasses:
+    - Luxury and budget travel planning
+    - Corporate retreat organization
+    - Cultural immersion experiences
+    - Adventure trip coordination
+    - Local cuisine exploration
+    - Transportation logistics
+    - Accommodation selection (Airbnb integration)
+    - Activity curation
+    - Budget optimization
+    - Group travel management
+    - Destination research and validation
+    - Seasonal travel considerations
+    - Accessibility planning
+    - Emergency contingency planning""")
+
+_INSTRUCTIONS = dedent("""\
+    COMPREHENSIVE TRAVEL PLANNING PROCESS:
+
+    1. INITIAL ASSESSMENT & CLARIFICATION 🎯
+       - Understand group size, composition, and dynamics
+       - Note specific travel dates, duration, and seasonality
+       - Identify budget constraints and preferences
+       - Clarify travel style (luxury, budget, adventure, cultural, etc.)
+       - Note any special requirements (accessibility, dietary, etc.)
+       - Understand trip purpose (vacation, business, celebration, etc.)
+
+    2. DESTINATION RESEARCH & VALIDATION 🔍
+       - Use Exa search to research destinations, attractions, and local insights
+       - Verify current operating hours, entry requirements, and availability
+       - Check for local events, festivals, or seasonal considerations
+       - Research weather patterns and climate during travel dates
+       - Identify potential challenges or travel advisories
+       - Validate transportation options and connectivity
+
+    3. ACCOMMODATION PLANNING & SELECTION 🏨
+       - Search for Airbnb accommodations using MCP tools when available
+       - Consider group size, preferences, and budget
+       - Select strategic locations near key activities/attractions
+       - Verify amenities, facilities, and guest reviews
+       - Include backup options and alternatives
+       - Check cancellation policies and booking flexibility
+
+    4. ACTIVITY CURATION & SCHEDULING 🎨
+       - Balance various interests and activity types
+       - Include authentic local experiences and cultural immersion
+       - Consider realistic travel time between venues
+       - Add flexible "free time" blocks for spontaneity
+       - Include backup activities for weather contingencies
+       - Note advance booking requirements and deadlines
+
+    5. LOGISTICS & TRANSPORTATION PLANNING 🚗
+       - Use Google Maps via MCP for accurate distances and travel times
+       - Detail transportation options (flights, trains, rental cars, etc.)
+       - Include local transport tips and cost estimates
+       - Consider accessibility requirements and options
+       - Plan airport transfers and inter-city travel
+       - Add contingency plans for delays or changes
+
+    6. BUDGET OPTIMIZATION & COST BREAKDOWN 💰
+       - Itemize major expense categories
+       - Provide realistic cost estimates for each component
+       - Include budget-saving tips and alternatives
+       - Note potential hidden costs and fees
+       - Suggest money-saving strategies without compromising experience
+       - Provide luxury upgrade options when applicable
+
+    7. LOCAL INSIGHTS & CULTURAL GUIDANCE 🗺️
+       - Include local customs, etiquette, and cultural norms
+       - Suggest appropriate dress codes for different venues
+       - Recommend local cuisine and dining experiences
+       - Provide language tips and essential phrases
+       - Note tipping customs and local payment methods
+       - Include safety tips and emergency contacts
+
+    RESPONSE STRUCTURE & FORMATTING:
+    - Use clear markdown formatting with emojis for visualization
+    - Present comprehensive day-by-day itineraries
+    - Include time estimates for all activities and travel
+    - Highlight "must-do" experiences and "hidden gems"
+    - Use tables for accommodation comparisons and budget breakdowns
+    - Add maps or location references when relevant
+    - Include booking requirements and advance notice needs
+    - Provide local tips and cultural notes throughout
+
+    QUALITY STANDARDS:
+    - Always verify information through Exa search
+    - Provide realistic time estimates and logistical plans
+    - Consider seasonal factors and local conditions
+    - Include contingency options for common travel disruptions
+    - Balance structured planning with flexibility
+    - Respect budget constraints while maximizing experience
+    - Prioritize safety, accessibility, and comfort
+""")
+
+_EXPECTED_OUTPUT = dedent("""\
+    # {Destination} Travel Itinerary 🌎
+
+    ## 📋 Trip Overview
+    - **Dates**: {travel_dates}
+    - **Duration**: {number_of_days} days
+    - **Group Size**: {group_size} people
+    - **Budget Range**: {budget_range}
+    - **Travel Style**: {travel_style}
+    - **Primary Focus**: {trip_focus}
+
+    ## 🏨 Accommodation Options
+
+    ### Recommended Stay:
+    **Property**: {accommodation_name}
+    **Type**: {property_type}
+    **Location**: {neighborhood_area}
+    **Key Features**: {amenities}
+    **Estimated Cost**: {cost_per_night}/night
+    **Booking Platform**: {booking_source}
+
+    ### Alternative Options:
+    1. {alternative_1} - {pros_and_cons}
+    2. {alternative_2} - {pros_and_cons}
+
+    ## 📅 Daily Itinerary
+
+    ### Day 1: Arrival & Orientation
+    **Theme**: {day_1_theme}
+
+    | Time | Activity | Details | Location | Estimated Cost |
+    |------|----------|---------|----------|----------------|
+    | {time} | {activity} | {details} | {location} | {cost} |
+    | {time} | {activity} | {details} | {location} | {cost} |
+
+    **Day 1 Notes**: {important_notes}
+
+    ### Day 2: {day_2_theme}
+    [Continue detailed schedule...]
+
+    ## 💰 Comprehensive Budget Breakdown
+
+    | Category | Estimated Cost | Notes |
+    |----------|----------------|-------|
+    | Accommodation | ${accom_cost} | {accom_notes} |
+    | Flights/Transport | ${transport_cost} | {transport_notes} |
+    | Activities & Tours | ${activities_cost} | {activities_notes} |
+    | Food & Dining | ${food_cost} | {food_notes} |
+    | Local Transportation | ${local_transport_cost} | {local_transport_notes} |
+    | Miscellaneous | ${misc_cost} | {misc_notes} |
+    | **Total Estimated** | **${total_cost}** | {total_notes} |
+
+    ## 🚗 Logistics & Transportation
+
+    ### Getting There:
+    {arrival_transport_details}
+
+    ### Local Transportation:
+    {local_transport_details}
+
+    ### Getting Around:
+    {getting_around_tips}
+
+    ## 📋 Booking Requirements & Timeline
+
+    **Immediate Action (Now):**
+    - {immediate_actions}
+
+    **Book Within 1 Month:**
+    - {one_month_actions}
+
+    **Book Within 2 Weeks:**
+    - {two_week_actions}
+
+    ## 🗺️ Local Tips & Cultural Insights
+
+    ### Cultural Etiquette:
+    {cultural_etiquette}
+
+    ### Dining & Cuisine:
+    {dining_tips}
+
+    ### Safety & Practical Tips:
+    {safety_tips}
+
+    ### Language Tips:
+    {language_tips}
+
+    ## ⚠️ Important Considerations
+
+    ### Weather & Seasonal Notes:
+    {weather_notes}
+
+    ### Health & Safety:
+    {health_safety}
+
+    ### Contingency Plans:
+    {contingency_plans}
+
+    ---
+    *Itinerary curated by Globe Hopper Travel Planning* 🌍
+    *Last Updated: {current_date}*
+    *Note: Prices and availability subject to change. Always verify current information before booking.*
+""")
+
+
+def _build_system_prompt() -> str:
+    """Compile the static system prompt shared by every request.
+
+    The result must be byte-identical across calls so that providers can
+    reuse their prompt-prefix cache; anything that changes per request
+    belongs in ``_build_request_context`` instead.
+    """
+    return (
+        f"{_DESCRIPTION}\n"
+        f"<instructions>\n{_INSTRUCTIONS.strip()}\n</instructions>\n\n"
+        "<additional_information>\n- Use markdown to format your answers.\n</additional_information>\n\n"
+        f"<expected_output>\n{_EXPECTED_OUTPUT.strip()}\n</expected_output>\n"
+    )
+
+
+SYSTEM_PROMPT = _build_system_prompt()
+
+
+def _build_request_context() -> dict[str, str]:
+    """Build the per-request context message that follows the static prompt."""
+    return {"role": "system", "content": f"The current date is {date.today().isoformat()}."}
+
+
+def _create_agent(model: OpenRouter, tools: list) -> Agent:
+    """Create the travel planning agent around the static system prompt."""
+    return Agent(
+        name="Globe Hopper - Travel Planning Expert",
+        model=model,
+        tools=tools,
+        system_message=SYSTEM_PROMPT,
+        resolve_in_context=False,
+        markdown=True,
+    )
+
+
 async def initialize_agent() -> None:
     """Initialize the travel planning agent."""
     global agent
@@ -182,216 +456,9 @@ async def initialize_agent() -> None:
         raise APIKeyError(error_msg)
 
     model = _create_llm_model(openrouter_api_key, model_name)
-    tools, mcp_tools = _setup_tools(mem0_api_key, exa_api_key)
+    tools, mcp_tools = await _setup_tools(mem0_api_key, exa_api_key)
 
-    # Create the travel planning agent
-    agent = Agent(
-        name="Globe Hopper - Travel Planning Expert",
-        model=model,
-        tools=tools,
-        description=dedent("""\
-            You are Globe Hopper, an elite travel planning expert with decades of experience! 🌍
-
-            Your expertise encompasses:
-            - Luxury and budget travel planning
-            - Corporate retreat organization
-            - Cultural immersion experiences
-            - Adventure trip coordination
-            - Local cuisine exploration
-            - Transportation logistics
-            - Accommodation selection (Airbnb integration)
-            - Activity curation
-            - Budget optimization
-            - Group travel management
-            - Destination research and validation
-            - Seasonal travel considerations
-            - Accessibility planning
-            - Emergency contingency planning"""),
-        instructions=dedent("""\
-            COMPREHENSIVE TRAVEL PLANNING PROCESS:
-
-            1. INITIAL ASSESSMENT & CLARIFICATION 🎯
-               - Understand group size, composition, and dynamics
-               - Note specific travel dates, duration, and seasonality
-               - Identify budget constraints and preferences
-               - Clarify travel style (luxury, budget, adventure, cultural, etc.)
-               - Note any special requirements (accessibility, dietary, etc.)
-               - Understand trip purpose (vacation, business, celebration, etc.)
-
-            2. DESTINATION RESEARCH & VALIDATION 🔍
-               - Use Exa search to research destinations, attractions, and local insights
-               - Verify current operating hours, entry requirements, and availability
-               - Check for local events, festivals, or seasonal considerations
-               - Research weather patterns and climate during travel dates
-               - Identify potential challenges or travel advisories
-               - Validate transportation options and connectivity
-
-            3. ACCOMMODATION PLANNING & SELECTION 🏨
-               - Search for Airbnb accommodations using MCP tools when available
-               - Consider group size, preferences, and budget
-               - Select strategic locations near key activities/attractions
-               - Verify amenities, facilities, and guest reviews
-               - Include backup options and alternatives
-               - Check cancellation policies and booking flexibility
-
-            4. ACTIVITY CURATION & SCHEDULING 🎨
-               - Balance various interests and activity types
-               - Include authentic local experiences and cultural immersion
-               - Consider realistic travel time between venues
-               - Add flexible "free time" blocks for spontaneity
-               - Include backup activities for weather contingencies
-               - Note advance booking requirements and deadlines
-
-            5. LOGISTICS & TRANSPORTATION PLANNING 🚗
-               - Use Google Maps via MCP for accurate distances and travel times
-               - Detail transportation options (flights, trains, rental cars, etc.)
-               - Include local transport tips and cost estimates
-               - Consider accessibility requirements and options
-               - Plan airport transfers and inter-city travel
-               - Add contingency plans for delays or changes
-
-            6. BUDGET OPTIMIZATION & COST BREAKDOWN 💰
-               - Itemize major expense categories
-               - Provide realistic cost estimates for each component
-               - Include budget-saving tips and alternatives
-               - Note potential hidden costs and fees
-               - Suggest money-saving strategies without compromising experience
-               - Provide luxury upgrade options when applicable
-
-            7. LOCAL INSIGHTS & CULTURAL GUIDANCE 🗺️
-               - Include local customs, etiquette, and cultural norms
-               - Suggest appropriate dress codes for different venues
-               - Recommend local cuisine and dining experiences
-               - Provide language tips and essential phrases
-               - Note tipping customs and local payment methods
-               - Include safety tips and emergency contacts
-
-            RESPONSE STRUCTURE & FORMATTING:
-            - Use clear markdown formatting with emojis for visualization
-            - Present comprehensive day-by-day itineraries
-            - Include time estimates for all activities and travel
-            - Highlight "must-do" experiences and "hidden gems"
-            - Use tables for accommodation comparisons and budget breakdowns
-            - Add maps or location references when relevant
-            - Include booking requirements and advance notice needs
-            - Provide local tips and cultural notes throughout
-
-            QUALITY STANDARDS:
-            - Always verify information through Exa search
-            - Provide realistic time estimates and logistical plans
-            - Consider seasonal factors and local conditions
-            - Include contingency options for common travel disruptions
-            - Balance structured planning with flexibility
-            - Respect budget constraints while maximizing experience
-            - Prioritize safety, accessibility, and comfort
-        """),
-        expected_output=dedent("""\
-            # {Destination} Travel Itinerary 🌎
-
-            ## 📋 Trip Overview
-            - **Dates**: {travel_dates}
-            - **Duration**: {number_of_days} days
-            - **Group Size**: {group_size} people
-            - **Budget Range**: {budget_range}
-            - **Travel Style**: {travel_style}
-            - **Primary Focus**: {trip_focus}
-
-            ## 🏨 Accommodation Options
-
-            ### Recommended Stay:
-            **Property**: {accommodation_name}
-            **Type**: {property_type}
-            **Location**: {neighborhood_area}
-            **Key Features**: {amenities}
-            **Estimated Cost**: {cost_per_night}/night
-            **Booking Platform**: {booking_source}
-
-            ### Alternative Options:
-            1. {alternative_1} - {pros_and_cons}
-            2. {alternative_2} - {pros_and_cons}
-
-            ## 📅 Daily Itinerary
-
-            ### Day 1: Arrival & Orientation
-            **Theme**: {day_1_theme}
-
-            | Time | Activity | Details | Location | Estimated Cost |
-            |------|----------|---------|----------|----------------|
-            | {time} | {activity} | {details} | {location} | {cost} |
-            | {time} | {activity} | {details} | {location} | {cost} |
-
-            **Day 1 Notes**: {important_notes}
-
-            ### Day 2: {day_2_theme}
-            [Continue detailed schedule...]
-
-            ## 💰 Comprehensive Budget Breakdown
-
-            | Category | Estimated Cost | Notes |
-            |----------|----------------|-------|
-            | Accommodation | ${accom_cost} | {accom_notes} |
-            | Flights/Transport | ${transport_cost} | {transport_notes} |
-            | Activities & Tours | ${activities_cost} | {activities_notes} |
-            | Food & Dining | ${food_cost} | {food_notes} |
-            | Local Transportation | ${local_transport_cost} | {local_transport_notes} |
-            | Miscellaneous | ${misc_cost} | {misc_notes} |
-            | **Total Estimated** | **${total_cost}** | {total_notes} |
-
-            ## 🚗 Logistics & Transportation
-
-            ### Getting There:
-            {arrival_transport_details}
-
-            ### Local Transportation:
-            {local_transport_details}
-
-            ### Getting Around:
-            {getting_around_tips}
-
-            ## 📋 Booking Requirements & Timeline
-
-            **Immediate Action (Now):**
-            - {immediate_actions}
-
-            **Book Within 1 Month:**
-            - {one_month_actions}
-
-            **Book Within 2 Weeks:**
-            - {two_week_actions}
-
-            ## 🗺️ Local Tips & Cultural Insights
-
-            ### Cultural Etiquette:
-            {cultural_etiquette}
-
-            ### Dining & Cuisine:
-            {dining_tips}
-
-            ### Safety & Practical Tips:
-            {safety_tips}
-
-            ### Language Tips:
-            {language_tips}
-
-            ## ⚠️ Important Considerations
-
-            ### Weather & Seasonal Notes:
-            {weather_notes}
-
-            ### Health & Safety:
-            {health_safety}
-
-            ### Contingency Plans:
-            {contingency_plans}
-
-            ---
-            *Itinerary curated by Globe Hopper Travel Planning* 🌍
-            *Last Updated: {current_date}*
-            *Note: Prices and availability subject to change. Always verify current information before booking.*
-        """),
-        add_datetime_to_context=True,
-        markdown=True,
-    )
+    agent = _create_agent(model, tools)
     print(f"✅ Travel Planning agent initialized using {model_name}")
     print("🌍 Exa research enabled for destination insights")
     if mem0_api_key:
@@ -401,14 +468,82 @@ async def initialize_agent() -> None:
 
 
 async def run_agent(messages: list[dict[str, str]]) -> Any:
-    """Run the agent with the given messages."""
+    """Run the agent with the given messages.
+
+    Inside a bindu task the run id is the bindu task id, so that ``tasks/cancel``
+    can reach the run through ``cancel_agent_run``. bindu passes no user
+    identity, so the conversation context id is used as the Mem0 user id:
+    memories are kept per conversation.
+    """
     global agent
 
     if not agent:
         error_msg = "Agent not initialized"
         raise RuntimeError(error_msg)
 
-    return await agent.arun(messages)  # type: ignore[invalid-await]
+    run_id = current_task_id() or str(uuid4())
+    _active_runs.add(run_id)
+    started = time.monotonic()
+
+    try:
+        response = await agent.arun(  # type: ignore[invalid-await]
+            [_build_request_context(), *messages], run_id=run_id, user_id=current_context_id()
+        )
+    except asyncio.CancelledError:
+        elapsed = time.monotonic() - started
+        _cancellation_stats["runs_cancelled"] += 1
+        _cancellation_stats["cancelled_run_seconds"] += elapsed
+        _logger.info("Cancelled agent run %s after %.2fs", run_id, elapsed)
+        raise
+    finally:
+        _active_runs.discard(run_id)
+
+    _record_prompt_cache_usage(run_id, response)
+    return response
+
+
+async def cancel_agent_run(run_id: str) -> bool:
+    """Flag an in-flight agent run as cancelled, returning False if it is not running.
+
+    agno checks the flag between model turns and tool calls, so a run whose
+    sync tools are still busy in worker threads stops once they return.
+    """
+    if agent is None or run_id not in _active_runs:
+        return False
+
+    _cancellation_stats["cancel_requests"] += 1
+    return await agent.acancel_run(run_id)
+
+
+def _record_prompt_cache_usage(run_id: str, response: Any) -> None:
+    """Log cached versus uncached input tokens reported by the provider."""
+    metrics = getattr(response, "metrics", None)
+    input_tokens = getattr(metrics, "input_tokens", None)
+    cached_tokens = getattr(metrics, "cache_read_tokens", None)
+    if not isinstance(input_tokens, int) or not isinstance(cached_tokens, int):
+        return
+
+    _prompt_cache_stats["requests"] += 1
+    _prompt_cache_stats["input_tokens"] += input_tokens
+    _prompt_cache_stats["cached_input_tokens"] += cached_tokens
+    _logger.info(
+        "Run %s input tokens: %d cached, %d uncached",
+        run_id,
+        cached_tokens,
+        input_tokens - cached_tokens,
+    )
+
+
+def get_prompt_cache_stats() -> dict[str, int]:
+    """Return cumulative cached and uncached input token counts."""
+    stats = dict(_prompt_cache_stats)
+    stats["uncached_input_tokens"] = stats["input_tokens"] - stats["cached_input_tokens"]
+    return stats
+
+
+def get_cancellation_stats() -> dict[str, float]:
+    """Return counters describing cancelled runs and the time they ran before being cancelled."""
+    return {**_cancellation_stats, "active_runs": len(_active_runs)}
 
 
 async def handler(messages: list[dict[str, str]]) -> Any:
@@ -427,6 +562,9 @@ async def handler(messages: list[dict[str, str]]) -> Any:
 async def cleanup() -> None:
     """Clean up any resources."""
     print("🧹 Cleaning up Travel Planning Agent resources...")
+    if memory_tools is not None:
+        await asyncio.to_thread(memory_tools.close)
+        print("🧠 Flushed pending memory writes")
 
 
 def _setup_environment_variables(args: argparse.Namespace) -> None:
@@ -511,6 +649,7 @@ def main() -> None:
     try:
         print("\n🚀 Starting Travel Planning Agent server...")
         print(f"🌐 Access at: {config.get('deployment', {}).get('url', 'http://127.0.0.1:3773')}")
+        install_task_cancellation(cancel_agent_run)
         bindufy(config, handler)
     except KeyboardInterrupt:
         print("\n🛑 Travel Planning Agent stopped")
@@ -0,0 +1,312 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Write-behind Mem0 memory with a local read cache.
+
+Wraps agno's ``Mem0Tools`` so that memory writes are queued and flushed to
+Mem0 in batches on a background thread, while reads are served from a
+per-user cache overlaid with the user's own recent writes.
+"""
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from agno.run import RunContext
+from agno.tools.mem0 import Mem0Tools
+
+_logger = logging.getLogger(__name__)
+
+
+def _is_rejected(error: Exception) -> bool:
+    """Whether Mem0 rejected the request itself, so that retrying it cannot succeed."""
+    debug_info = getattr(error, "debug_info", None)
+    status = debug_info.get("status_code") if isinstance(debug_info, dict) else None
+    return isinstance(status, int) and 400 <= status < 500 and status not in (408, 429)
+
+
+@dataclass
+class _LocalMemory:
+    """A memory written during this process, kept until Mem0 reflects it."""
+
+    content: str
+    flushed_at: float | None = None
+
+
+@dataclass
+class _UserCache:
+    """Cached Mem0 state for a single user."""
+
+    memories: list[dict[str, Any]] | None = None
+    fetched_at: float = float("-inf")
+    searches: dict[str, tuple[float, list[dict[str, Any]]]] = field(default_factory=dict)
+    local: list[_LocalMemory] = field(default_factory=list)
+
+
+class CachedMem0Tools(Mem0Tools):
+    """Mem0 toolkit with batched background writes and a per-user read cache."""
+
+    def __init__(
+        self,
+        *args: Any,
+        cache_ttl_seconds: float = 300.0,
+        flush_interval_seconds: float = 2.0,
+        max_batch_size: int = 20,
+        local_grace_seconds: float = 120.0,
+        max_cached_users: int = 1000,
+        max_cached_searches: int = 32,
+        max_local_memories: int = 100,
+        max_pending_writes: int = 1000,
+        max_flush_attempts: int = 5,
+        **kwargs: Any,
+    ) -> None:
+        """Create the toolkit and start the background flusher."""
+        super().__init__(*args, **kwargs)
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_batch_size = max_batch_size
+        self.local_grace_seconds = local_grace_seconds
+        self.max_cached_users = max_cached_users
+        self.max_cached_searches = max_cached_searches
+        self.max_local_memories = max_local_memories
+        self.max_pending_writes = max_pending_writes
+        self.max_flush_attempts = max_flush_attempts
+
+        self._cache: dict[str, _UserCache] = {}
+        self._pending: dict[str, list[str]] = {}
+        # Consecutive failed flushes per user and when the next attempt is due.
+        self._failures: dict[str, tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="mem0-write-behind", daemon=True)
+        self._flusher.start()
+
+    def _user_cache(self, user_id: str) -> _UserCache:
+        # Dict order doubles as LRU order: touched users move to the end.
+        entry = self._cache.pop(user_id, None) or _UserCache()
+        self._cache[user_id] = entry
+        if len(self._cache) > self.max_cached_users:
+            for stale in list(self._cache)[: len(self._cache) - self.max_cached_users]:
+                if stale not in self._pending:
+                    del self._cache[stale]
+        return entry
+
+    def add_memory(self, run_context: RunContext, content: str | dict[str, str]) -> str:
+        """Add facts to the user's memory.
+
+        Args:
+            content(Union[str, Dict[str, str]]): The facts that should be stored.
+        Returns:
+            str: JSON-encoded acknowledgement or an error message.
+        """
+        user_id = self._get_user_id("add_memory", run_context=run_context)
+        if user_id.startswith("Error in add_memory:"):
+            return user_id
+
+        text = json.dumps(content) if isinstance(content, dict) else str(content)
+        with self._lock:
+            queued = sum(len(contents) for contents in self._pending.values())
+            if queued >= self.max_pending_writes:
+                return f"Error in add_memory: {queued} memories are still waiting to be saved, try again later"
+            entry = self._user_cache(user_id)
+            entry.local.append(_LocalMemory(text))
+            self._prune_local(entry)
+            pending = self._pending.setdefault(user_id, [])
+            pending.append(text)
+            batch_full = len(pending) >= self.max_batch_size
+
+        if batch_full:
+            self._wakeup.set()
+        return json.dumps({"status": "queued", "memory": text})
+
+    def search_memory(self, run_context: RunContext, query: str) -> str:
+        """Semantic search for *query* across the user's stored memories."""
+        user_id = self._get_user_id("search_memory", run_context=run_context)
+        if user_id.startswith("Error in search_memory:"):
+            return user_id
+
+        key = " ".join(query.lower().split())
+        now = time.monotonic()
+        with self._lock:
+            cached = self._user_cache(user_id).searches.get(key)
+        if cached is not None and now - cached[0] < self.cache_ttl_seconds:
+            results = cached[1]
+        else:
+            raw = super().search_memory(run_context, query)
+            try:
+                results = json.loads(raw)
+            except json.JSONDecodeError:
+                return raw
+            with self._lock:
+                searches = self._user_cache(user_id).searches
+                searches.pop(key, None)
+                searches[key] = (now, results)
+                while len(searches) > self.max_cached_searches:
+                    del searches[next(iter(searches))]
+
+        terms = set(key.split())
+        local = [m for m in self._local_memories(user_id) if terms & set(m["memory"].lower().split())]
+        return json.dumps(local + results)
+
+    def get_all_memories(self, run_context: RunContext) -> str:
+        """Return **all** memories for the current user as a JSON string."""
+        user_id = self._get_user_id("get_all_memories", run_context=run_context)
+        if user_id.startswith("Error in get_all_memories:"):
+            return user_id
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._user_cache(user_id)
+            memories = entry.memories if now - entry.fetched_at < self.cache_ttl_seconds else None
+        if memories is None:
+            raw = super().get_all_memories(run_context)
+            try:
+                memories = json.loads(raw)
+            except json.JSONDecodeError:
+                return raw
+            with self._lock:
+                entry = self._user_cache(user_id)
+                entry.memories, entry.fetched_at = memories, now
+
+        return json.dumps(self._local_memories(user_id) + memories)
+
+    def delete_all_memories(self, run_context: RunContext) -> str:
+        """Delete *all* memories associated with the current user."""
+        user_id = self._get_user_id("delete_all_memories", run_context=run_context)
+        if user_id.startswith("Error in delete_all_memories:"):
+            return user_id
+
+        # Holding the flush lock keeps a batch for this user from being sent
+        # or re-queued while the delete is in progress.
+        with self._flush_lock:
+            with self._lock:
+                self._pending.pop(user_id, None)
+                self._failures.pop(user_id, None)
+                self._cache.pop(user_id, None)
+            return super().delete_all_memories(run_context)
+
+    def _local_memories(self, user_id: str) -> list[dict[str, Any]]:
+        with self._lock:
+            entry = self._user_cache(user_id)
+            self._prune_local(entry)
+            local = list(entry.local)
+        return [{"memory": m.content, "user_id": user_id, "pending": m.flushed_at is None} for m in local]
+
+    def _prune_local(self, entry: _UserCache) -> None:
+        """Drop local writes once a read from Mem0 can be trusted to include them.
+
+        Mem0 indexes added memories asynchronously and usually rewrites them, so
+        a flushed write is kept until a remote read returns it verbatim or a
+        remote read is made at least ``local_grace_seconds`` after the flush.
+        """
+        remote = {str(m.get("memory", "")).strip().lower() for m in entry.memories or [] if isinstance(m, dict)}
+        refreshed_at = entry.fetched_at if entry.memories is not None else float("-inf")
+        for searched_at, results in entry.searches.values():
+            remote.update(str(m.get("memory", "")).strip().lower() for m in results if isinstance(m, dict))
+            refreshed_at = max(refreshed_at, searched_at)
+
+        entry.local = [
+            m
+            for m in entry.local
+            if m.flushed_at is None
+            or (refreshed_at - m.flushed_at < self.local_grace_seconds and m.content.strip().lower() not in remote)
+        ][-self.max_local_memories :]
+
+    def _flush_loop(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval_seconds)
+            self._wakeup.clear()
+            self._flush(due_only=True)
+
+    def flush(self) -> int:
+        """Send all queued writes to Mem0, one batched call per user."""
+        return self._flush(due_only=False)
+
+    def _flush(self, due_only: bool) -> int:
+        with self._flush_lock:
+            now = time.monotonic()
+            with self._lock:
+                users = [u for u in self._pending if not due_only or self._failures.get(u, (0, now))[1] <= now]
+                batches = {user_id: self._pending.pop(user_id) for user_id in users}
+
+            return sum(self._flush_user(user_id, contents) for user_id, contents in batches.items())
+
+    def _flush_user(self, user_id: str, contents: list[str]) -> int:
+        try:
+            self._send(user_id, contents)
+        except Exception as error:
+            if len(contents) > 1 and _is_rejected(error):
+                return self._flush_one_by_one(user_id, contents)
+            self._retry_later(user_id, contents, error)
+            return 0
+        return len(contents)
+
+    def _flush_one_by_one(self, user_id: str, contents: list[str]) -> int:
+        """Send a rejected batch one memory at a time so that only the bad memories are dropped."""
+        flushed = 0
+        for i, content in enumerate(contents):
+            try:
+                self._send(user_id, [content])
+            except Exception as error:
+                if not _is_rejected(error):
+                    self._retry_later(user_id, contents[i:], error)
+                    break
+                self._drop(user_id, [content], error)
+            else:
+                flushed += 1
+        return flushed
+
+    def _send(self, user_id: str, contents: list[str]) -> None:
+        messages = [{"role": "user", "content": content} for content in contents]
+        self.client.add(messages, user_id=user_id, infer=self.infer)
+
+        flushed_at = time.monotonic()
+        with self._lock:
+            self._failures.pop(user_id, None)
+            entry = self._user_cache(user_id)
+            # Mem0 now holds memories the cached reads do not, so refetch on the next read.
+            entry.memories = None
+            entry.searches.clear()
+            for memory in entry.local:
+                if memory.flushed_at is None and memory.content in contents:
+                    memory.flushed_at = flushed_at
+
+    def _retry_later(self, user_id: str, contents: list[str], error: Exception) -> None:
+        with self._lock:
+            attempts = self._failures.get(user_id, (0, 0.0))[0] + 1
+            if _is_rejected(error) or attempts >= self.max_flush_attempts:
+                self._failures.pop(user_id, None)
+            else:
+                _logger.warning(
+                    "Failed to flush %d memories for %s (attempt %d): %s", len(contents), user_id, attempts, error
+                )
+                backoff = self.flush_interval_seconds * 2**attempts
+                self._failures[user_id] = (attempts, time.monotonic() + backoff)
+                self._pending.setdefault(user_id, [])[:0] = contents
+                return
+        self._drop(user_id, contents, error)
+
+    def _drop(self, user_id: str, contents: list[str], error: Exception) -> None:
+        _logger.error("Dropping %d memories for %s that Mem0 did not accept: %s", len(contents), user_id, error)
+        with self._lock:
+            entry = self._cache.get(user_id)
+            if entry is not None:
+                entry.local = [m for m in entry.local if m.flushed_at is not None or m.content not in contents]
+
+    def close(self) -> None:
+        """Stop the background flusher and write out anything still queued."""
+        self._stopped.set()
+        self._wakeup.set()
+        self._flusher.join(timeout=self.flush_interval_seconds + 5)
+        self.flush()
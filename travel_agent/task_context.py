@@ -0,0 +1,112 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Bind bindu task execution to the agent run that serves it.
+
+bindu calls ``handler`` with the message history only, and its ``tasks/cancel``
+just queues an operation that marks the task ``canceled`` in storage. Its
+worker handles one operation at a time, so that operation is not even picked
+up before the running task has finished.
+
+``install_task_cancellation`` makes the worker execute each task in its own
+asyncio task, registered under the bindu task id, and makes ``tasks/cancel``
+cancel that asyncio task before bindu queues its own operation. Code running
+inside a task can read the task and context ids through ``current_task_id``
+and ``current_context_id``.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from typing import Any
+
+from bindu.server.handlers.task_handlers import TaskHandlers
+from bindu.server.workers.manifest_worker import ManifestWorker
+
+_logger = logging.getLogger(__name__)
+
+_current_task_id: ContextVar[str | None] = ContextVar("bindu_task_id", default=None)
+_current_context_id: ContextVar[str | None] = ContextVar("bindu_context_id", default=None)
+_executions: dict[str, asyncio.Task[None]] = {}
+_on_cancel: Callable[[str], Awaitable[object]] | None = None
+_installed = False
+
+
+def current_task_id() -> str | None:
+    """Return the id of the bindu task being executed, if any."""
+    return _current_task_id.get()
+
+
+def current_context_id() -> str | None:
+    """Return the id of the bindu conversation context being executed, if any."""
+    return _current_context_id.get()
+
+
+async def cancel_task(task_id: str) -> bool:
+    """Stop the execution of bindu task *task_id*, returning False if it is not running."""
+    execution = _executions.get(task_id)
+    if execution is None or execution.done():
+        return False
+
+    # Runs the cancel hook first, so the agent run is flagged before the
+    # CancelledError unwinds it.
+    if _on_cancel is not None:
+        await _on_cancel(task_id)
+    execution.cancel()
+    return True
+
+
+async def _run_cancellable(run_task: Callable[..., Awaitable[None]], worker: Any, params: Any) -> None:
+    task_id = str(params["task_id"])
+    task_token = _current_task_id.set(task_id)
+    context_token = _current_context_id.set(str(params["context_id"]))
+    try:
+        execution = asyncio.ensure_future(run_task(worker, params))
+    finally:
+        _current_context_id.reset(context_token)
+        _current_task_id.reset(task_token)
+
+    _executions[task_id] = execution
+    try:
+        await execution
+    except asyncio.CancelledError:
+        current = asyncio.current_task()
+        if not execution.cancelled() or (current is not None and current.cancelling()):
+            raise
+        # The worker is free again; bindu's queued cancel operation marks the task canceled.
+        _logger.info("Stopped execution of cancelled task %s", task_id)
+    finally:
+        _executions.pop(task_id, None)
+
+
+def install_task_cancellation(on_cancel: Callable[[str], Awaitable[object]]) -> None:
+    """Route bindu task execution and ``tasks/cancel`` through this module.
+
+    *on_cancel* is awaited with the task id right before a running task is cancelled.
+    """
+    global _installed, _on_cancel
+
+    _on_cancel = on_cancel
+    if _installed:
+        return
+
+    run_task = ManifestWorker.run_task
+    handle_cancel = TaskHandlers.cancel_task
+
+    async def cancellable_run_task(self: ManifestWorker, params: Any) -> None:
+        await _run_cancellable(run_task, self, params)
+
+    async def cancelling_cancel_task(self: TaskHandlers, request: Any) -> Any:
+        await cancel_task(str(request["params"]["task_id"]))
+        return await handle_cancel(self, request)
+
+    ManifestWorker.run_task = cancellable_run_task  # type: ignore[method-assign]
+    TaskHandlers.cancel_task = cancelling_cancel_task  # type: ignore[method-assign]
+    _installed = True